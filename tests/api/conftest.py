@@ -2,16 +2,31 @@
 
 This module provides reusable fixtures for testing the Eero API layer,
 mocking HTTP responses and session management at the aiohttp boundary.
+
+Nothing here touches the filesystem or network, and session/module-scoped
+fixtures are only ever cached per process, so the package runs unchanged
+under pytest-xdist (``pytest -n auto tests/api``).
 """
 
 import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiohttp import ClientResponseError, ClientSession
 
+from eero.api.eeros import EerosAPI
+from eero.api.forwards import ForwardsAPI
+from eero.api.insights import InsightsAPI
+from eero.api.networks import NetworksAPI
+from eero.api.ouicheck import OUICheckAPI
+from eero.api.password import PasswordAPI
+from eero.api.profiles import ProfilesAPI
+from eero.api.reservations import ReservationsAPI
+from eero.api.routing import RoutingAPI
+from eero.api.schedule import ScheduleAPI
+
 # ==================== Mock Response Helpers ====================
 
 
@@ -90,6 +105,53 @@ def create_mock_response(
     return mock_response
 
 
+class StubResponse:
+    """Lightweight stand-in for a successful aiohttp JSON response.
+
+    Implements only what ``BaseAPI`` reads (``status``, ``headers`` and
+    ``content.iter_chunked``) plus the async context manager protocol, with
+    no MagicMock bookkeeping. Use :func:`create_mock_response` when a test
+    needs error behavior or call assertions on the response itself.
+    """
+
+    __slots__ = ("status", "headers", "content", "_data")
+
+    status: int
+    headers: Dict[str, str]
+    content: "_StubContent"
+    _data: Dict[str, Any]
+
+    def __init__(self, status: int = 200, json_data: Optional[Dict[str, Any]] = None) -> None:
+        self.status = status
+        self.headers = {}
+        self._data = json_data or {}
+        self.content = _StubContent(json.dumps(self._data).encode("utf-8"))
+
+    async def json(self) -> Dict[str, Any]:
+        return self._data
+
+    async def __aenter__(self) -> "StubResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class _StubContent:
+    """Body stream for :class:`StubResponse`."""
+
+    __slots__ = ("_body",)
+
+    _body: bytes
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, chunk_size: int) -> AsyncIterator[bytes]:
+        for offset in range(0, len(self._body), chunk_size):
+            yield self._body[offset : offset + chunk_size]
+
+
 def api_success_response(data: Any, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Create a standard Eero API success response structure.
 
@@ -126,6 +188,21 @@ def api_error_response(code: int, error: str, message: Optional[str] = None) ->
     }
 
 
+# Envelope for endpoints that acknowledge with an empty payload. Shared by
+# reference, so treat it as read-only.
+EMPTY_OK: Dict[str, Any] = {"meta": {"code": 200}, "data": {}}
+
+
+@pytest.fixture(scope="session")
+def empty_ok_response() -> StubResponse:
+    """Shared ``200 {"meta": {"code": 200}, "data": {}}`` stub response.
+
+    Built once per session. Tests may assign it to
+    ``mock_session.request.return_value`` but must not reconfigure it.
+    """
+    return StubResponse(200, EMPTY_OK)
+
+
 # ==================== Sample Data Fixtures ====================
 
 
@@ -277,14 +354,25 @@ def mock_cookie_jar():
     return jar
 
 
+@pytest.fixture(scope="session")
+def _cached_session() -> MagicMock:
+    """Build the spec'd MagicMock behind ``mock_session`` once per worker."""
+    return MagicMock(spec=ClientSession)
+
+
 @pytest.fixture
-def mock_session(mock_cookie_jar):
+def mock_session(_cached_session, mock_cookie_jar):
     """Create a mock aiohttp ClientSession.
 
     This is the primary fixture for mocking HTTP requests.
     Configure responses by setting mock_session.request.return_value.
+
+    The ``ClientSession`` spec is introspected once per worker; the mock is
+    reset and its request methods rebuilt before each test, so calls and
+    configured responses never carry over.
     """
-    session = MagicMock(spec=ClientSession)
+    session = _cached_session
+    session.reset_mock(return_value=True, side_effect=True)
     session.cookie_jar = mock_cookie_jar
 
     # Make request method return an async context manager
@@ -308,6 +396,39 @@ def mock_session(mock_cookie_jar):
     return session
 
 
+class RequestRecorder:
+    """Plain-callable replacement for ``mock_session.request``.
+
+    Appends ``(method, url, kwargs)`` to :attr:`calls` and returns the
+    configured response, without MagicMock's ``call_args`` bookkeeping.
+    """
+
+    __slots__ = ("response", "calls")
+
+    response: Any
+    calls: List[Tuple[str, str, Dict[str, Any]]]
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.calls = []
+
+    def __call__(self, method: str, url: str, **kwargs: Any) -> Any:
+        self.calls.append((method, url, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def recorded_requests(mock_session, empty_ok_response) -> RequestRecorder:
+    """Record requests made through ``mock_session`` for payload assertions.
+
+    Every request answers with ``empty_ok_response`` unless
+    ``recorder.response`` is reassigned.
+    """
+    recorder = RequestRecorder(empty_ok_response)
+    mock_session.request = recorder
+    return recorder
+
+
 @pytest.fixture
 def mock_keyring():
     """Mock keyring module for secure storage tests."""
@@ -341,25 +462,241 @@ def expired_session_data() -> Dict[str, Any]:
     }
 
 
+# ==================== Auth Stubs ====================
+
+
+async def _no_session_refresh() -> bool:
+    """Stand-in for ``AuthAPI.refresh_session`` that never refreshes."""
+    return False
+
+
+async def no_auth_token() -> None:
+    """``get_auth_token`` replacement for exercising the "Not authenticated" path.
+
+    A plain coroutine function is far cheaper than an AsyncMock and none of
+    the tests assert on token calls.
+    """
+    return None
+
+
+class StubAuthAPI:
+    """Hand-rolled stand-in for AuthAPI.
+
+    Carries only what AuthenticatedAPI subclasses touch (``session``,
+    ``get_auth_token`` and ``refresh_session``), avoiding MagicMock's
+    child-mock and call-tracking machinery on every fixture setup.
+    ``get_auth_token`` is a plain attribute, so tests can still swap in
+    another coroutine function (e.g. one resolving to ``None``).
+    """
+
+    __slots__ = ("session", "get_auth_token", "refresh_session")
+
+    session: Any
+    get_auth_token: Callable[[], Awaitable[Optional[str]]]
+    refresh_session: Callable[[], Awaitable[bool]]
+
+    def __init__(self, session: Any, token: Optional[str] = "auth_token") -> None:
+        self.reset(session, token)
+
+    def reset(self, session: Any, token: Optional[str] = "auth_token") -> None:
+        """Rebind the stub to ``session`` and restore its token coroutine."""
+
+        async def _get_auth_token() -> Optional[str]:
+            return token
+
+        self.session = session
+        self.get_auth_token = _get_auth_token
+        self.refresh_session = _no_session_refresh
+
+
 # ==================== Auth API Fixtures ====================
 
 
+@pytest.fixture(scope="session")
+def _cached_auth_api() -> MagicMock:
+    """Build the MagicMock behind ``mock_auth_api`` once per worker."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_auth_api(mock_session):
+def mock_auth_api(_cached_auth_api, mock_session):
     """Create a mock AuthAPI for testing API modules.
 
     This fixture provides a mock AuthAPI that can be used with any
-    AuthenticatedAPI subclass. Configure auth token by setting:
-    mock_auth_api.get_auth_token = AsyncMock(return_value="token")
+    AuthenticatedAPI subclass. ``get_auth_token`` resolves to ``"test_token"``;
+    request ``mock_auth_api_unauth`` for the not-authenticated path.
+
+    The mock is cached per worker and reset before each test, so calls,
+    configured return values and the auth token never carry over.
     """
-    auth_api = MagicMock()
+    auth_api = _cached_auth_api
+    auth_api.reset_mock(return_value=True, side_effect=True)
     auth_api.session = mock_session
-    auth_api.get_auth_token = AsyncMock(return_value="test_auth_token")
+    auth_api.get_auth_token = AsyncMock(return_value="test_token")
     auth_api._base_url = "https://api.e.eero.com"
     return auth_api
 
 
 @pytest.fixture
+def mock_auth_api_unauth(mock_auth_api):
+    """``mock_auth_api`` whose ``get_auth_token`` resolves to ``None``."""
+    mock_auth_api.get_auth_token = no_auth_token
+    return mock_auth_api
+
+
+# ==================== Domain API Fixtures ====================
+#
+# Each domain API is built once per module around a StubAuthAPI.  The public
+# function-scoped fixture rebinds the stub to the test's ``mock_session`` and
+# restores the default token, so per-test overrides (for example a
+# ``get_auth_token`` that resolves to ``None``) never leak into the next test.
+
+
+def _bind_cached_api(api: Any, session: Any) -> Any:
+    """Reset a module-cached API's stub auth for the current test."""
+    api._auth_api.reset(session)
+    return api
+
+
+@pytest.fixture(scope="module")
+def _module_eeros_api():
+    """Build one EerosAPI per test module."""
+    return EerosAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def eeros_api(_module_eeros_api, mock_session):
+    """Create an EerosAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_eeros_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_forwards_api():
+    """Build one ForwardsAPI per test module."""
+    return ForwardsAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def forwards_api(_module_forwards_api, mock_session):
+    """Create a ForwardsAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_forwards_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_insights_api():
+    """Build one InsightsAPI per test module."""
+    return InsightsAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def insights_api(_module_insights_api, mock_session):
+    """Create an InsightsAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_insights_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_networks_api():
+    """Build one NetworksAPI per test module."""
+    return NetworksAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def networks_api(_module_networks_api, mock_session):
+    """Create a NetworksAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_networks_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_ouicheck_api():
+    """Build one OUICheckAPI per test module."""
+    return OUICheckAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def ouicheck_api(_module_ouicheck_api, mock_session):
+    """Create an OUICheckAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_ouicheck_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_password_api():
+    """Build one PasswordAPI per test module."""
+    return PasswordAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def password_api(_module_password_api, mock_session):
+    """Create a PasswordAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_password_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_profiles_api():
+    """Build one ProfilesAPI per test module."""
+    return ProfilesAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def profiles_api(_module_profiles_api, mock_session):
+    """Create a ProfilesAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_profiles_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_reservations_api():
+    """Build one ReservationsAPI per test module."""
+    return ReservationsAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def reservations_api(_module_reservations_api, mock_session):
+    """Create a ReservationsAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_reservations_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_routing_api():
+    """Build one RoutingAPI per test module."""
+    return RoutingAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def routing_api(_module_routing_api, mock_session):
+    """Create a RoutingAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_routing_api, mock_session)
+
+
+@pytest.fixture(scope="module")
+def _module_schedule_api():
+    """Build one ScheduleAPI per test module."""
+    return ScheduleAPI(StubAuthAPI(None))
+
+
+@pytest.fixture
+def schedule_api(_module_schedule_api, mock_session):
+    """Create a ScheduleAPI backed by a StubAuthAPI."""
+    return _bind_cached_api(_module_schedule_api, mock_session)
+
+
+@pytest.fixture
+def stub_api_method(monkeypatch):
+    """Install AsyncMock stubs over API methods for the current test.
+
+    Returns ``install(api, name, return_value=None)``, which replaces
+    ``api.<name>`` via ``monkeypatch`` and returns the stub for assertions.
+    The originals are restored on teardown, so tests need no ``with
+    patch.object(...)`` block.
+    """
+
+    def _install(api: Any, name: str, return_value: Any = None) -> AsyncMock:
+        stub = AsyncMock(return_value=return_value)
+        monkeypatch.setattr(api, name, stub)
+        return stub
+
+    return _install
+
+
+@pytest.fixture(scope="session")
 def mock_api_response():
     """Create a helper function for generating API responses.
 
@@ -1,12 +1,12 @@
 """Unit tests for the BackupAPI module."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from eero.api.backup import BackupAPI
 from eero.exceptions import EeroAuthenticationException
 
+from .conftest import EMPTY_OK
+
 
 class TestBackupAPIInitialization:
     """Tests for BackupAPI initialization."""
@@ -20,10 +20,11 @@ class TestBackupAPIInitialization:
 class TestGetBackupNetwork:
     """Tests for get_backup_network method."""
 
-    async def test_get_backup_network_returns_raw_response(self, mock_auth_api, mock_api_response):
+    async def test_get_backup_network_returns_raw_response(
+        self, mock_auth_api, mock_api_response, stub_api_method
+    ):
         """Test get_backup_network returns raw API response."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
         backup_data = {
             "enabled": True,
@@ -31,21 +32,19 @@ class TestGetBackupNetwork:
             "phone_number": "+1234567890",
         }
 
-        with patch.object(api, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_api_response(backup_data)
-            result = await api.get_backup_network("network123")
+        mock_get = stub_api_method(api, "get", mock_api_response(backup_data))
+        result = await api.get_backup_network("network123")
 
-            assert "meta" in result
-            assert "data" in result
-            mock_get.assert_called_once_with(
-                "networks/network123/backup",
-                auth_token="test_token",
-            )
+        assert "meta" in result
+        assert "data" in result
+        mock_get.assert_called_once_with(
+            "networks/network123/backup",
+            auth_token="test_token",
+        )
 
-    async def test_get_backup_network_not_authenticated(self, mock_auth_api):
+    async def test_get_backup_network_not_authenticated(self, mock_auth_api_unauth):
         """Test get_backup_network raises exception when not authenticated."""
-        api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = BackupAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.get_backup_network("network123")
@@ -54,10 +53,11 @@ class TestGetBackupNetwork:
 class TestGetBackupStatus:
     """Tests for get_backup_status method."""
 
-    async def test_get_backup_status_returns_raw_response(self, mock_auth_api, mock_api_response):
+    async def test_get_backup_status_returns_raw_response(
+        self, mock_auth_api, mock_api_response, stub_api_method
+    ):
         """Test get_backup_status returns raw API response."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
         status_data = {
             "active": True,
@@ -65,21 +65,19 @@ class TestGetBackupStatus:
             "signal_strength": 75,
         }
 
-        with patch.object(api, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_api_response(status_data)
-            result = await api.get_backup_status("network123")
+        mock_get = stub_api_method(api, "get", mock_api_response(status_data))
+        result = await api.get_backup_status("network123")
 
-            assert "meta" in result
-            assert "data" in result
-            mock_get.assert_called_once_with(
-                "networks/network123/backup/status",
-                auth_token="test_token",
-            )
+        assert "meta" in result
+        assert "data" in result
+        mock_get.assert_called_once_with(
+            "networks/network123/backup/status",
+            auth_token="test_token",
+        )
 
-    async def test_get_backup_status_not_authenticated(self, mock_auth_api):
+    async def test_get_backup_status_not_authenticated(self, mock_auth_api_unauth):
         """Test get_backup_status raises exception when not authenticated."""
-        api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = BackupAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.get_backup_status("network123")
@@ -88,26 +86,25 @@ class TestGetBackupStatus:
 class TestSetBackupNetwork:
     """Tests for set_backup_network method."""
 
-    async def test_set_backup_network_returns_raw_response(self, mock_auth_api, mock_api_response):
+    async def test_set_backup_network_returns_raw_response(
+        self, mock_auth_api, mock_api_response, stub_api_method
+    ):
         """Test set_backup_network returns raw API response."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
-        with patch.object(api, "put", new_callable=AsyncMock) as mock_put:
-            mock_put.return_value = {"meta": {"code": 200}, "data": {}}
-            result = await api.set_backup_network("network123", enabled=True)
+        mock_put = stub_api_method(api, "put", EMPTY_OK)
+        result = await api.set_backup_network("network123", enabled=True)
 
-            assert "meta" in result
-            mock_put.assert_called_once_with(
-                "networks/network123/backup",
-                auth_token="test_token",
-                json={"enabled": True},
-            )
+        assert "meta" in result
+        mock_put.assert_called_once_with(
+            "networks/network123/backup",
+            auth_token="test_token",
+            json={"enabled": True},
+        )
 
-    async def test_set_backup_network_not_authenticated(self, mock_auth_api):
+    async def test_set_backup_network_not_authenticated(self, mock_auth_api_unauth):
         """Test set_backup_network raises exception when not authenticated."""
-        api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = BackupAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.set_backup_network("network123", enabled=True)
@@ -117,59 +114,52 @@ class TestConfigureBackupNetwork:
     """Tests for configure_backup_network method."""
 
     async def test_configure_backup_network_returns_raw_response(
-        self, mock_auth_api, mock_api_response
+        self, mock_auth_api, mock_api_response, stub_api_method
     ):
         """Test configure_backup_network returns raw API response."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
-        with patch.object(api, "put", new_callable=AsyncMock) as mock_put:
-            mock_put.return_value = {"meta": {"code": 200}, "data": {}}
-            result = await api.configure_backup_network("network123", enabled=True)
+        mock_put = stub_api_method(api, "put", EMPTY_OK)
+        result = await api.configure_backup_network("network123", enabled=True)
 
-            assert "meta" in result
-            mock_put.assert_called_once_with(
-                "networks/network123/backup",
-                auth_token="test_token",
-                json={"enabled": True},
-            )
+        assert "meta" in result
+        mock_put.assert_called_once_with(
+            "networks/network123/backup",
+            auth_token="test_token",
+            json={"enabled": True},
+        )
 
     async def test_configure_backup_network_with_phone_number(
-        self, mock_auth_api, mock_api_response
+        self, mock_auth_api, mock_api_response, stub_api_method
     ):
         """Test configure_backup_network with phone number."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
-        with patch.object(api, "put", new_callable=AsyncMock) as mock_put:
-            mock_put.return_value = {"meta": {"code": 200}, "data": {}}
-            result = await api.configure_backup_network("network123", phone_number="+1234567890")
+        mock_put = stub_api_method(api, "put", EMPTY_OK)
+        result = await api.configure_backup_network("network123", phone_number="+1234567890")
 
-            assert "meta" in result
-            mock_put.assert_called_once_with(
-                "networks/network123/backup",
-                auth_token="test_token",
-                json={"phone_number": "+1234567890"},
-            )
+        assert "meta" in result
+        mock_put.assert_called_once_with(
+            "networks/network123/backup",
+            auth_token="test_token",
+            json={"phone_number": "+1234567890"},
+        )
 
     async def test_configure_backup_network_no_settings_returns_raw(
-        self, mock_auth_api, mock_api_response
+        self, mock_auth_api, mock_api_response, stub_api_method
     ):
         """Test configure_backup_network with no settings returns raw response."""
         api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
-        with patch.object(api, "put", new_callable=AsyncMock) as mock_put:
-            mock_put.return_value = {"meta": {"code": 200}, "data": {}}
-            result = await api.configure_backup_network("network123")
+        stub_api_method(api, "put", EMPTY_OK)
+        result = await api.configure_backup_network("network123")
 
-            # With no settings, method should return raw response
-            assert "meta" in result
+        # With no settings, method should return raw response
+        assert "meta" in result
 
-    async def test_configure_backup_network_not_authenticated(self, mock_auth_api):
+    async def test_configure_backup_network_not_authenticated(self, mock_auth_api_unauth):
         """Test configure_backup_network raises exception when not authenticated."""
-        api = BackupAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = BackupAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.configure_backup_network("network123", enabled=True)
@@ -250,20 +250,19 @@ class TestEeroClientEnsureNetworkId:
 class TestEeroClientCacheIntegration:
     """Integration tests for cache behavior."""
 
-    @pytest.mark.asyncio
-    async def test_cache_timeout_respected(self, mock_session):
+    def test_cache_timeout_respected(self, mock_session, monkeypatch):
         """Test that cache timeout is respected."""
         # Very short timeout for testing
         client = EeroClient(session=mock_session, cache_timeout=1)
+        now = time.monotonic()
+        monkeypatch.setattr("eero.client.time.monotonic", lambda: now)
 
         # Populate cache
         client._update_cache("networks", None, [{"id": "test"}])
         assert client._is_cache_valid("networks") is True
 
-        # Wait for cache to expire
-        import asyncio
-
-        await asyncio.sleep(1.1)
+        # Advance the clock past the timeout instead of sleeping through it
+        monkeypatch.setattr("eero.client.time.monotonic", lambda: now + 1.1)
 
         assert client._is_cache_valid("networks") is False
 
@@ -1,7 +1,5 @@
 """Unit tests for the DiagnosticsAPI module."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from eero.api.diagnostics import DiagnosticsAPI
@@ -20,31 +18,30 @@ class TestDiagnosticsAPIInitialization:
 class TestGetDiagnostics:
     """Tests for get_diagnostics method."""
 
-    async def test_get_diagnostics_returns_raw_response(self, mock_auth_api, mock_api_response):
+    async def test_get_diagnostics_returns_raw_response(
+        self, mock_auth_api, mock_api_response, stub_api_method
+    ):
         """Test get_diagnostics returns raw API response."""
         api = DiagnosticsAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
         diagnostics_data = {
             "network_health": "good",
             "internet_status": "connected",
         }
 
-        with patch.object(api, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_api_response(diagnostics_data)
-            result = await api.get_diagnostics("network123")
+        mock_get = stub_api_method(api, "get", mock_api_response(diagnostics_data))
+        result = await api.get_diagnostics("network123")
 
-            assert "meta" in result
-            assert "data" in result
-            mock_get.assert_called_once_with(
-                "networks/network123/diagnostics",
-                auth_token="test_token",
-            )
+        assert "meta" in result
+        assert "data" in result
+        mock_get.assert_called_once_with(
+            "networks/network123/diagnostics",
+            auth_token="test_token",
+        )
 
-    async def test_get_diagnostics_not_authenticated(self, mock_auth_api):
+    async def test_get_diagnostics_not_authenticated(self, mock_auth_api_unauth):
         """Test get_diagnostics raises exception when not authenticated."""
-        api = DiagnosticsAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = DiagnosticsAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.get_diagnostics("network123")
@@ -53,32 +50,31 @@ class TestGetDiagnostics:
 class TestRunDiagnostics:
     """Tests for run_diagnostics method."""
 
-    async def test_run_diagnostics_returns_raw_response(self, mock_auth_api, mock_api_response):
+    async def test_run_diagnostics_returns_raw_response(
+        self, mock_auth_api, mock_api_response, stub_api_method
+    ):
         """Test run_diagnostics returns raw API response."""
         api = DiagnosticsAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value="test_token")
 
         run_result = {
             "status": "completed",
             "started_at": "2024-01-15T10:00:00Z",
         }
 
-        with patch.object(api, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_api_response(run_result)
-            result = await api.run_diagnostics("network123")
+        mock_post = stub_api_method(api, "post", mock_api_response(run_result))
+        result = await api.run_diagnostics("network123")
 
-            assert "meta" in result
-            assert "data" in result
-            mock_post.assert_called_once_with(
-                "networks/network123/diagnostics",
-                auth_token="test_token",
-                json={},
-            )
+        assert "meta" in result
+        assert "data" in result
+        mock_post.assert_called_once_with(
+            "networks/network123/diagnostics",
+            auth_token="test_token",
+            json={},
+        )
 
-    async def test_run_diagnostics_not_authenticated(self, mock_auth_api):
+    async def test_run_diagnostics_not_authenticated(self, mock_auth_api_unauth):
         """Test run_diagnostics raises exception when not authenticated."""
-        api = DiagnosticsAPI(mock_auth_api)
-        mock_auth_api.get_auth_token = AsyncMock(return_value=None)
+        api = DiagnosticsAPI(mock_auth_api_unauth)
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await api.run_diagnostics("network123")
@@ -79,44 +79,38 @@ class TestEeroAPIInit:
         assert hasattr(api, "password")
 
 
-class TestEeroAPISubAPIs:
-    """Tests for sub-API types."""
-
-    def test_networks_api_type(self):
-        """Test that networks is a NetworksAPI."""
-        api = EeroAPI()
-        assert isinstance(api.networks, NetworksAPI)
-
-    def test_devices_api_type(self):
-        """Test that devices is a DevicesAPI."""
-        api = EeroAPI()
-        assert isinstance(api.devices, DevicesAPI)
+@pytest.fixture(scope="class")
+def shared_api():
+    """Create a single EeroAPI shared by the read-only checks in a test class."""
+    return EeroAPI()
 
-    def test_eeros_api_type(self):
-        """Test that eeros is an EerosAPI."""
-        api = EeroAPI()
-        assert isinstance(api.eeros, EerosAPI)
 
-    def test_profiles_api_type(self):
-        """Test that profiles is a ProfilesAPI."""
-        api = EeroAPI()
-        assert isinstance(api.profiles, ProfilesAPI)
+class TestEeroAPISubAPIs:
+    """Tests for sub-API types."""
 
-    def test_sub_apis_share_auth(self):
+    @pytest.mark.parametrize(
+        "name,cls",
+        [
+            ("networks", NetworksAPI),
+            ("devices", DevicesAPI),
+            ("eeros", EerosAPI),
+            ("profiles", ProfilesAPI),
+        ],
+    )
+    def test_sub_api_type(self, shared_api, name, cls):
+        """Test that each core sub-API has the expected type."""
+        assert isinstance(getattr(shared_api, name), cls)
+
+    def test_sub_apis_share_auth(self, shared_api):
         """Test that all sub-APIs share the same AuthAPI instance."""
-        api = EeroAPI()
-
         # All authenticated APIs should reference the same auth
-        assert api.networks._auth_api is api.auth
-        assert api.devices._auth_api is api.auth
-        assert api.eeros._auth_api is api.auth
-        assert api.profiles._auth_api is api.auth
+        for name in ("networks", "devices", "eeros", "profiles"):
+            assert getattr(shared_api, name)._auth_api is shared_api.auth, name
 
 
 class TestEeroAPIContextManager:
     """Tests for EeroAPI async context manager."""
 
-    @pytest.mark.asyncio
     async def test_context_manager_enters_auth(self, mock_session, mock_keyring):
         """Test that entering context manager enters auth API."""
         api = EeroAPI(session=mock_session, use_keyring=True)
@@ -129,7 +123,6 @@ class TestEeroAPIContextManager:
         assert result is api
         api.auth.__aenter__.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_context_manager_exits_auth(self, mock_session):
         """Test that exiting context manager exits auth API."""
         api = EeroAPI(session=mock_session, use_keyring=False)
@@ -154,7 +147,6 @@ class TestEeroAPIAuthentication:
         # Initially not authenticated
         assert api.is_authenticated is False
 
-    @pytest.mark.asyncio
     async def test_login_delegates_to_auth(self, mock_session):
         """Test that login delegates to auth API."""
         api = EeroAPI(session=mock_session, use_keyring=False)
@@ -165,7 +157,6 @@ class TestEeroAPIAuthentication:
         assert result is True
         api.auth.login.assert_awaited_once_with("test@example.com")
 
-    @pytest.mark.asyncio
     async def test_verify_delegates_to_auth(self, mock_session):
         """Test that verify delegates to auth API."""
         api = EeroAPI(session=mock_session, use_keyring=False)
@@ -176,7 +167,6 @@ class TestEeroAPIAuthentication:
         assert result is True
         api.auth.verify.assert_awaited_once_with("123456")
 
-    @pytest.mark.asyncio
     async def test_logout_delegates_to_auth(self, mock_session):
         """Test that logout delegates to auth API."""
         api = EeroAPI(session=mock_session, use_keyring=False)
@@ -8,14 +8,12 @@ Tests cover:
 - Nightlight control (enable, brightness, schedule)
 """
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.eeros import EerosAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
 
 
 class TestEerosAPIInit:
@@ -23,8 +21,7 @@ class TestEerosAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
 
         api = EerosAPI(auth_api)
 
@@ -34,20 +31,11 @@ class TestEerosAPIInit:
 class TestEerosAPIGetEeros:
     """Tests for get_eeros method."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_eeros_returns_raw_response(self, eeros_api, mock_session, sample_eero_data):
         """Test get_eeros returns raw API response."""
         eeros_list = [sample_eero_data]
         expected_response = api_success_response(eeros_list)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await eeros_api.get_eeros("network_123")
@@ -55,31 +43,14 @@ class TestEerosAPIGetEeros:
         assert "meta" in result
         assert "data" in result
 
-    @pytest.mark.asyncio
-    async def test_get_eeros_not_authenticated(self, eeros_api):
-        """Test get_eeros raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await eeros_api.get_eeros("network_123")
-
 
 class TestEerosAPIGetEero:
     """Tests for get_eero method."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_eero_returns_raw_response(self, eeros_api, mock_session, sample_eero_data):
         """Test get_eero returns raw API response."""
         expected_response = api_success_response(sample_eero_data)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await eeros_api.get_eero("network_123", "eero_001")
@@ -89,54 +60,17 @@ class TestEerosAPIGetEero:
         assert result["data"]["serial"] == "ABC123456789"
         assert result["data"]["model"] == "eero Pro 6E"
 
-    @pytest.mark.asyncio
-    async def test_get_eero_not_authenticated(self, eeros_api):
-        """Test get_eero raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.get_eero("network_123", "eero_001")
-
 
 class TestEerosAPIReboot:
     """Tests for reboot_eero method."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_reboot_returns_raw_response(self, eeros_api, mock_session):
-        """Test successful eero reboot returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+    async def test_reboot_returns_raw_response(self, eeros_api, mock_session, empty_ok_response):
+        """Test eero reboot sends an empty JSON body and returns raw response."""
+        mock_session.request.return_value = empty_ok_response
 
         result = await eeros_api.reboot_eero("network_123", "eero_001")
 
         assert "meta" in result
-
-    @pytest.mark.asyncio
-    async def test_reboot_not_authenticated(self, eeros_api):
-        """Test reboot raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.reboot_eero("network_123", "eero_001")
-
-    @pytest.mark.asyncio
-    async def test_reboot_sends_empty_body(self, eeros_api, mock_session):
-        """Test that reboot sends empty JSON body."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await eeros_api.reboot_eero("network_123", "eero_001")
-
         call_args = mock_session.request.call_args
         assert call_args.kwargs["json"] == {}
 
@@ -144,15 +78,6 @@ class TestEerosAPIReboot:
 class TestEerosAPILedStatus:
     """Tests for LED status methods."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_led_status_returns_raw_response(self, eeros_api, mock_session):
         """Test getting LED status returns raw response."""
         eero_data = {
@@ -161,7 +86,7 @@ class TestEerosAPILedStatus:
             "led_brightness": 75,
         }
         expected_response = api_success_response(eero_data)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await eeros_api.get_led_status("network_123", "eero_001")
@@ -171,32 +96,13 @@ class TestEerosAPILedStatus:
         assert result["data"]["led_on"] is True
         assert result["data"]["led_brightness"] == 75
 
-    @pytest.mark.asyncio
-    async def test_get_led_status_not_authenticated(self, eeros_api):
-        """Test get_led_status raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.get_led_status("network_123", "eero_001")
-
 
 class TestEerosAPILedControl:
     """Tests for LED control methods."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_led_returns_raw_response(self, eeros_api, mock_session):
+    async def test_set_led_returns_raw_response(self, eeros_api, mock_session, empty_ok_response):
         """Test turning LED on returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await eeros_api.set_led("network_123", "eero_001", True)
 
@@ -204,84 +110,31 @@ class TestEerosAPILedControl:
         call_args = mock_session.request.call_args
         assert call_args.kwargs["json"] == {"led_on": True}
 
-    @pytest.mark.asyncio
-    async def test_set_led_not_authenticated(self, eeros_api):
-        """Test set_led raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.set_led("network_123", "eero_001", True)
-
 
 class TestEerosAPILedBrightness:
     """Tests for LED brightness control."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_led_brightness_returns_raw_response(self, eeros_api, mock_session):
-        """Test setting LED brightness returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+    @pytest.mark.parametrize(
+        "brightness,expected",
+        [(50, 50), (-10, 0), (150, 100)],
+        ids=["in_range", "clamps_min", "clamps_max"],
+    )
+    async def test_set_led_brightness(
+        self, eeros_api, mock_session, empty_ok_response, brightness, expected
+    ):
+        """Test setting LED brightness returns raw response and clamps to 0-100."""
+        mock_session.request.return_value = empty_ok_response
 
-        result = await eeros_api.set_led_brightness("network_123", "eero_001", 50)
+        result = await eeros_api.set_led_brightness("network_123", "eero_001", brightness)
 
         assert "meta" in result
         call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"led_brightness": 50}
-
-    @pytest.mark.asyncio
-    async def test_set_led_brightness_clamps_min(self, eeros_api, mock_session):
-        """Test that brightness is clamped to minimum 0."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await eeros_api.set_led_brightness("network_123", "eero_001", -10)
-
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"led_brightness": 0}
-
-    @pytest.mark.asyncio
-    async def test_set_led_brightness_clamps_max(self, eeros_api, mock_session):
-        """Test that brightness is clamped to maximum 100."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await eeros_api.set_led_brightness("network_123", "eero_001", 150)
-
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"led_brightness": 100}
-
-    @pytest.mark.asyncio
-    async def test_set_led_brightness_not_authenticated(self, eeros_api):
-        """Test set_led_brightness raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.set_led_brightness("network_123", "eero_001", 50)
+        assert call_args.kwargs["json"] == {"led_brightness": expected}
 
 
 class TestEerosAPINightlightGet:
     """Tests for getting nightlight settings."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_nightlight_returns_raw_response(self, eeros_api, mock_session):
         """Test getting nightlight settings returns raw response."""
         eero_data = {
@@ -295,7 +148,7 @@ class TestEerosAPINightlightGet:
             },
         }
         expected_response = api_success_response(eero_data)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await eeros_api.get_nightlight("network_123", "eero_beacon")
@@ -304,32 +157,15 @@ class TestEerosAPINightlightGet:
         assert "data" in result
         assert result["data"]["nightlight"]["enabled"] is True
 
-    @pytest.mark.asyncio
-    async def test_get_nightlight_not_authenticated(self, eeros_api):
-        """Test get_nightlight raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.get_nightlight("network_123", "eero_beacon")
-
 
 class TestEerosAPINightlightSet:
     """Tests for setting nightlight settings."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_nightlight_returns_raw_response(self, eeros_api, mock_session):
+    async def test_set_nightlight_returns_raw_response(
+        self, eeros_api, mock_session, empty_ok_response
+    ):
         """Test enabling nightlight returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await eeros_api.set_nightlight("network_123", "eero_beacon", enabled=True)
 
@@ -337,37 +173,26 @@ class TestEerosAPINightlightSet:
         call_args = mock_session.request.call_args
         assert call_args.kwargs["json"] == {"nightlight": {"enabled": True}}
 
-    @pytest.mark.asyncio
-    async def test_set_nightlight_brightness(self, eeros_api, mock_session):
-        """Test setting nightlight brightness."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+    @pytest.mark.parametrize(
+        "brightness,expected",
+        [(50, 50), (-10, 0), (150, 100)],
+        ids=["in_range", "clamps_min", "clamps_max"],
+    )
+    async def test_set_nightlight_brightness(
+        self, eeros_api, mock_session, empty_ok_response, brightness, expected
+    ):
+        """Test setting nightlight brightness clamps to 0-100."""
+        mock_session.request.return_value = empty_ok_response
 
-        result = await eeros_api.set_nightlight("network_123", "eero_beacon", brightness=50)
+        result = await eeros_api.set_nightlight("network_123", "eero_beacon", brightness=brightness)
 
         assert "meta" in result
         call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"nightlight": {"brightness": 50}}
-
-    @pytest.mark.asyncio
-    async def test_set_nightlight_brightness_clamped(self, eeros_api, mock_session):
-        """Test that nightlight brightness is clamped to 0-100."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await eeros_api.set_nightlight("network_123", "eero_beacon", brightness=150)
-
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"nightlight": {"brightness": 100}}
+        assert call_args.kwargs["json"] == {"nightlight": {"brightness": expected}}
 
-    @pytest.mark.asyncio
-    async def test_set_nightlight_schedule(self, eeros_api, mock_session):
+    async def test_set_nightlight_schedule(self, eeros_api, mock_session, empty_ok_response):
         """Test setting nightlight schedule."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await eeros_api.set_nightlight(
             "network_123",
@@ -384,57 +209,57 @@ class TestEerosAPINightlightSet:
         assert payload["nightlight"]["schedule"]["on"] == "20:00"
         assert payload["nightlight"]["schedule"]["off"] == "06:00"
 
-    @pytest.mark.asyncio
-    async def test_set_nightlight_no_settings_returns_raw_response(self, eeros_api, mock_session):
+    async def test_set_nightlight_no_settings_returns_raw_response(
+        self, eeros_api, mock_session, empty_ok_response
+    ):
         """Test that setting no nightlight settings returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await eeros_api.set_nightlight("network_123", "eero_beacon")
 
         assert "meta" in result
 
-    @pytest.mark.asyncio
-    async def test_set_nightlight_not_authenticated(self, eeros_api):
-        """Test set_nightlight raises when not authenticated."""
-        eeros_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await eeros_api.set_nightlight("network_123", "eero_beacon", enabled=True)
-
 
 class TestEerosAPINightlightConvenience:
     """Tests for nightlight convenience methods."""
 
-    @pytest.fixture
-    def eeros_api(self, mock_session):
-        """Create an EerosAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return EerosAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_nightlight_brightness_convenience(self, eeros_api, mock_session):
-        """Test set_nightlight_brightness convenience method."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await eeros_api.set_nightlight_brightness("network_123", "eero_beacon", 80)
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("set_nightlight_brightness", ("network_123", "eero_beacon", 80)),
+            ("set_nightlight_schedule", ("network_123", "eero_beacon", True, "21:00", "07:00")),
+        ],
+    )
+    async def test_convenience_returns_raw_response(
+        self, eeros_api, mock_session, empty_ok_response, method, args
+    ):
+        """Test nightlight convenience methods return raw response."""
+        mock_session.request.return_value = empty_ok_response
+
+        result = await getattr(eeros_api, method)(*args)
 
         assert "meta" in result
 
-    @pytest.mark.asyncio
-    async def test_set_nightlight_schedule_convenience(self, eeros_api, mock_session):
-        """Test set_nightlight_schedule convenience method."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
 
-        result = await eeros_api.set_nightlight_schedule(
-            "network_123", "eero_beacon", True, "21:00", "07:00"
-        )
+class TestEerosAPINotAuthenticated:
+    """Tests that every EerosAPI call requires an auth token."""
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_eeros", ("network_123",)),
+            ("get_eero", ("network_123", "eero_001")),
+            ("reboot_eero", ("network_123", "eero_001")),
+            ("get_led_status", ("network_123", "eero_001")),
+            ("set_led", ("network_123", "eero_001", True)),
+            ("set_led_brightness", ("network_123", "eero_001", 50)),
+            ("get_nightlight", ("network_123", "eero_beacon")),
+            ("set_nightlight", ("network_123", "eero_beacon", True)),
+        ],
+    )
+    async def test_not_authenticated(self, eeros_api, method, args):
+        """Test each method raises when not authenticated."""
+        eeros_api._auth_api.get_auth_token = no_auth_token
 
-        assert "meta" in result
+        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
+            await getattr(eeros_api, method)(*args)
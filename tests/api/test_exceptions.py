@@ -7,6 +7,8 @@ Tests cover:
 - Resource type handling for not found exceptions
 """
 
+import pytest
+
 from eero.exceptions import (
     EeroAPIException,
     EeroAuthenticationException,
@@ -75,9 +77,9 @@ class TestEeroAPIException:
         exc = EeroAPIException(400, "Bad request")
         assert isinstance(exc, EeroException)
 
-    def test_various_status_codes(self):
-        """Test with various HTTP status codes."""
-        codes_and_messages = [
+    @pytest.mark.parametrize(
+        "code,message",
+        [
             (400, "Bad Request"),
             (401, "Unauthorized"),
             (403, "Forbidden"),
@@ -86,12 +88,13 @@ class TestEeroAPIException:
             (500, "Internal Server Error"),
             (502, "Bad Gateway"),
             (503, "Service Unavailable"),
-        ]
-
-        for code, message in codes_and_messages:
-            exc = EeroAPIException(code, message)
-            assert exc.status_code == code
-            assert message in str(exc)
+        ],
+    )
+    def test_various_status_codes(self, code, message):
+        """Test with various HTTP status codes."""
+        exc = EeroAPIException(code, message)
+        assert exc.status_code == code
+        assert message in str(exc)
 
 
 class TestEeroRateLimitException:
@@ -156,13 +159,13 @@ class TestEeroNotFoundException:
         exc = EeroNotFoundException("eero", "eero_001")
         assert isinstance(exc, EeroException)
 
-    def test_various_resource_types(self):
+    @pytest.mark.parametrize(
+        "resource_type", ["network", "device", "eero", "profile", "reservation"]
+    )
+    def test_various_resource_types(self, resource_type):
         """Test with various resource types."""
-        resource_types = ["network", "device", "eero", "profile", "reservation"]
-
-        for resource_type in resource_types:
-            exc = EeroNotFoundException(resource_type, f"{resource_type}_123")
-            assert resource_type in str(exc)
+        exc = EeroNotFoundException(resource_type, f"{resource_type}_123")
+        assert resource_type in str(exc)
 
 
 class TestEeroPremiumRequiredException:
@@ -233,44 +236,28 @@ class TestEeroValidationException:
         assert isinstance(exc, EeroException)
 
 
+EXCEPTION_CASES = [
+    (EeroAuthenticationException, ("test",)),
+    (EeroAPIException, (400, "test")),
+    (EeroRateLimitException, ("test",)),
+    (EeroNetworkException, ("test",)),
+    (EeroTimeoutException, ("test",)),
+    (EeroNotFoundException, ("resource", "id")),
+    (EeroPremiumRequiredException, ()),
+    (EeroFeatureUnavailableException, ("feature",)),
+    (EeroValidationException, ("field", "message")),
+]
+
+
 class TestExceptionHierarchy:
     """Tests for overall exception hierarchy."""
 
-    def test_all_exceptions_inherit_from_base(self):
-        """Test that all exceptions inherit from EeroException."""
-        exception_classes = [
-            EeroAuthenticationException("test"),
-            EeroAPIException(400, "test"),
-            EeroRateLimitException("test"),
-            EeroNetworkException("test"),
-            EeroTimeoutException("test"),
-            EeroNotFoundException("resource", "id"),
-            EeroPremiumRequiredException(),
-            EeroFeatureUnavailableException("feature"),
-            EeroValidationException("field", "message"),
-        ]
-
-        for exc in exception_classes:
-            assert isinstance(
-                exc, EeroException
-            ), f"{type(exc).__name__} should inherit from EeroException"
-
-    def test_all_exceptions_are_catchable_by_base(self):
-        """Test that all exceptions can be caught by base exception."""
-
-        def raise_and_catch(exc_class, *args, **kwargs):
-            try:
-                raise exc_class(*args, **kwargs)
-            except EeroException as e:
-                return e
-            return None
-
-        assert raise_and_catch(EeroAuthenticationException, "test") is not None
-        assert raise_and_catch(EeroAPIException, 400, "test") is not None
-        assert raise_and_catch(EeroRateLimitException, "test") is not None
-        assert raise_and_catch(EeroNetworkException, "test") is not None
-        assert raise_and_catch(EeroTimeoutException, "test") is not None
-        assert raise_and_catch(EeroNotFoundException, "type", "id") is not None
-        assert raise_and_catch(EeroPremiumRequiredException) is not None
-        assert raise_and_catch(EeroFeatureUnavailableException, "feature") is not None
-        assert raise_and_catch(EeroValidationException, "field", "msg") is not None
+    @pytest.mark.parametrize(
+        "exc_class,args", EXCEPTION_CASES, ids=[cls.__name__ for cls, _ in EXCEPTION_CASES]
+    )
+    def test_is_catchable_as_eero_exception(self, exc_class, args):
+        """Test that every exception inherits from and is catchable as EeroException."""
+        with pytest.raises(EeroException) as exc_info:
+            raise exc_class(*args)
+
+        assert type(exc_info.value) is exc_class
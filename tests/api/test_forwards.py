@@ -1,13 +1,14 @@
 """Tests for ForwardsAPI module."""
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.forwards import ForwardsAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
+
+FORWARDS_DATA_LIST = [{"port": 80, "protocol": "tcp", "device_id": "device123"}]
+FORWARDS_DATA_NESTED = {"data": [{"port": 443, "protocol": "tcp", "device_id": "device456"}]}
 
 
 class TestForwardsAPIInit:
@@ -15,8 +16,7 @@ class TestForwardsAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
         api = ForwardsAPI(auth_api)
         assert api._auth_api is auth_api
 
@@ -24,83 +24,71 @@ class TestForwardsAPIInit:
 class TestForwardsAPIGetForwards:
     """Tests for get_forwards method."""
 
-    @pytest.fixture
-    def forwards_api(self, mock_session):
-        """Create a ForwardsAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ForwardsAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_get_forwards_returns_raw_response(self, forwards_api, mock_session):
-        """Test get_forwards returns raw response."""
-        forwards_data = [{"port": 80, "protocol": "tcp", "device_id": "device123"}]
-        mock_response = create_mock_response(200, api_success_response(forwards_data))
+    @pytest.mark.parametrize(
+        "forwards_data",
+        [FORWARDS_DATA_LIST, FORWARDS_DATA_NESTED, []],
+        ids=["list", "nested", "empty"],
+    )
+    async def test_get_forwards_returns_raw_response(
+        self, forwards_api, mock_session, forwards_data
+    ):
+        """Test get_forwards passes every response shape through untouched."""
+        raw = api_success_response(forwards_data)
+        mock_response = StubResponse(200, raw)
         mock_session.request.return_value = mock_response
 
         result = await forwards_api.get_forwards("network_123")
 
-        assert "meta" in result
-        assert "data" in result
-
-    @pytest.mark.asyncio
-    async def test_get_forwards_not_authenticated(self, forwards_api):
-        """Test get_forwards raises when not authenticated."""
-        forwards_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await forwards_api.get_forwards("network_123")
+        assert result == raw
 
 
 class TestForwardsAPICreateForward:
     """Tests for create_forward method."""
 
-    @pytest.fixture
-    def forwards_api(self, mock_session):
-        """Create a ForwardsAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ForwardsAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_create_forward_returns_raw_response(self, forwards_api, mock_session):
-        """Test create_forward returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
+    async def test_create_forward_returns_raw_response(
+        self, forwards_api, mock_session, empty_ok_response
+    ):
+        """Test create_forward posts the payload unchanged and returns raw response."""
+        mock_session.request.return_value = empty_ok_response
 
-        forward_data = {"port": 80, "protocol": "tcp"}
-        result = await forwards_api.create_forward("network_123", forward_data)
+        result = await forwards_api.create_forward("network_123", {"port": 80, "protocol": "tcp"})
 
         assert "meta" in result
-
-    @pytest.mark.asyncio
-    async def test_create_forward_not_authenticated(self, forwards_api):
-        """Test create_forward raises when not authenticated."""
-        forwards_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await forwards_api.create_forward("network_123", {})
+        assert mock_session.request.call_count == 1
+        method, url = mock_session.request.call_args.args
+        assert method == "POST"
+        assert url.endswith("/networks/network_123/forwards")
+        assert mock_session.request.call_args.kwargs["json"] == {"port": 80, "protocol": "tcp"}
 
 
 class TestForwardsAPIDeleteForward:
     """Tests for delete_forward method."""
 
-    @pytest.fixture
-    def forwards_api(self, mock_session):
-        """Create a ForwardsAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ForwardsAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_delete_forward_returns_raw_response(self, forwards_api, mock_session):
+    async def test_delete_forward_returns_raw_response(
+        self, forwards_api, mock_session, empty_ok_response
+    ):
         """Test delete_forward returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await forwards_api.delete_forward("network_123", "forward_id")
 
         assert "meta" in result
+
+
+class TestForwardsAPINotAuthenticated:
+    """Tests that every ForwardsAPI call requires an auth token."""
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_forwards", ("network_123",)),
+            ("create_forward", ("network_123", {})),
+            ("delete_forward", ("network_123", "forward_id")),
+        ],
+    )
+    async def test_not_authenticated(self, forwards_api, method, args):
+        """Test each method raises when not authenticated."""
+        forwards_api._auth_api.get_auth_token = no_auth_token
+
+        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
+            await getattr(forwards_api, method)(*args)
@@ -1,13 +1,14 @@
 """Tests for InsightsAPI module."""
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.insights import InsightsAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
+
+INSIGHTS_DATA = {"series": []}
+INSIGHT_DATA = {"series": [{"insight_type": "adblock"}]}
 
 
 class TestInsightsAPIInit:
@@ -15,8 +16,7 @@ class TestInsightsAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
         api = InsightsAPI(auth_api)
         assert api._auth_api is auth_api
 
@@ -29,18 +29,9 @@ class TestInsightsAPIGetInsights:
     Only cadence has an SDK-supplied default of "daily".
     """
 
-    @pytest.fixture
-    def insights_api(self, mock_session):
-        """Create an InsightsAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return InsightsAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_insights_forwards_all_params(self, insights_api, mock_session):
         """Test all four required params (start/end/insight_type/cadence) are sent."""
-        mock_response = create_mock_response(200, api_success_response({"series": []}))
+        mock_response = StubResponse(200, api_success_response(INSIGHTS_DATA))
         mock_session.request.return_value = mock_response
 
         await insights_api.get_insights(
@@ -59,10 +50,9 @@ class TestInsightsAPIGetInsights:
             "insight_type": "adblock",
         }
 
-    @pytest.mark.asyncio
     async def test_get_insights_cadence_defaults_to_daily(self, insights_api, mock_session):
         """Test cadence defaults to 'daily' when caller omits it (only SDK default)."""
-        mock_response = create_mock_response(200, api_success_response({"series": []}))
+        mock_response = StubResponse(200, api_success_response(INSIGHTS_DATA))
         mock_session.request.return_value = mock_response
 
         await insights_api.get_insights(
@@ -75,11 +65,10 @@ class TestInsightsAPIGetInsights:
         params = mock_session.request.call_args.kwargs["params"]
         assert params["cadence"] == "daily"
 
-    @pytest.mark.asyncio
     async def test_get_insights_returns_raw_response(self, insights_api, mock_session):
         """Test get_insights returns raw response without transformation."""
-        raw = {"meta": {"code": 200}, "data": {"series": [{"insight_type": "adblock"}]}}
-        mock_response = create_mock_response(200, raw)
+        raw = {"meta": {"code": 200}, "data": INSIGHT_DATA}
+        mock_response = StubResponse(200, raw)
         mock_session.request.return_value = mock_response
 
         result = await insights_api.get_insights(
@@ -92,7 +81,6 @@ class TestInsightsAPIGetInsights:
         # v2.0 contract: envelope passes through untouched.
         assert result == raw
 
-    @pytest.mark.asyncio
     async def test_get_insights_requires_keyword_args(self, insights_api):
         """Test start/end/insight_type are keyword-only (positional call raises)."""
         with pytest.raises(TypeError):
@@ -100,37 +88,42 @@ class TestInsightsAPIGetInsights:
                 "network_123", "2026-07-21T00:00:00Z"  # type: ignore[call-arg]
             )
 
-    @pytest.mark.asyncio
-    async def test_get_insights_not_authenticated(self, insights_api):
-        """Test get_insights raises when not authenticated."""
-        insights_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await insights_api.get_insights(
-                "network_123",
-                start="2026-07-21T00:00:00Z",
-                end="2026-07-22T00:00:00Z",
-                insight_type="adblock",
-            )
-
 
 class TestInsightsAPIRunInsights:
     """Tests for run_insights method."""
 
-    @pytest.fixture
-    def insights_api(self, mock_session):
-        """Create an InsightsAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return InsightsAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_run_insights_returns_raw_response(self, insights_api, mock_session):
+    async def test_run_insights_returns_raw_response(
+        self, insights_api, mock_session, empty_ok_response
+    ):
         """Test run_insights returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await insights_api.run_insights("network_123")
 
         assert "meta" in result
+
+
+class TestInsightsAPINotAuthenticated:
+    """Tests that every InsightsAPI call requires an auth token."""
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs",
+        [
+            (
+                "get_insights",
+                ("network_123",),
+                {
+                    "start": "2026-07-21T00:00:00Z",
+                    "end": "2026-07-22T00:00:00Z",
+                    "insight_type": "adblock",
+                },
+            ),
+            ("run_insights", ("network_123",), {}),
+        ],
+    )
+    async def test_not_authenticated(self, insights_api, method, args, kwargs):
+        """Test each method raises when not authenticated."""
+        insights_api._auth_api.get_auth_token = no_auth_token
+
+        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
+            await getattr(insights_api, method)(*args, **kwargs)
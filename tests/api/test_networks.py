@@ -10,14 +10,21 @@ Tests cover:
 - Setting network name
 """
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.networks import NetworksAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
+
+SPEED_DATA = {
+    "down": {"value": 500.0, "units": "Mbps"},
+    "up": {"value": 50.0, "units": "Mbps"},
+}
+PREMIUM_NETWORK_DATA = {
+    "id": "network_123",
+    "premium_status": {"active": True, "features": ["ad-block", "malware"]},
+}
 
 
 class TestNetworksAPIInit:
@@ -25,8 +32,7 @@ class TestNetworksAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
 
         api = NetworksAPI(auth_api)
 
@@ -36,23 +42,13 @@ class TestNetworksAPIInit:
 class TestNetworksAPIGetNetworks:
     """Tests for get_networks method."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        api = NetworksAPI(auth_api)
-        return api
-
-    @pytest.mark.asyncio
     async def test_get_networks_returns_raw_response(
-        self, networks_api, mock_session, sample_networks_list
+        self, networks_api, recorded_requests, sample_networks_list
     ):
         """Test get_networks returns raw API response."""
         expected_response = api_success_response({"networks": sample_networks_list})
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
         result = await networks_api.get_networks()
 
@@ -61,34 +57,17 @@ class TestNetworksAPIGetNetworks:
         assert "data" in result
         assert result["data"]["networks"] == sample_networks_list
 
-    @pytest.mark.asyncio
-    async def test_get_networks_not_authenticated(self, networks_api):
-        """Test get_networks raises when not authenticated."""
-        networks_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await networks_api.get_networks()
-
 
 class TestNetworksAPIGetNetwork:
     """Tests for get_network method."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_network_returns_raw_response(
-        self, networks_api, mock_session, sample_network_data
+        self, networks_api, recorded_requests, sample_network_data
     ):
         """Test get_network returns raw API response."""
         expected_response = api_success_response(sample_network_data)
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
         result = await networks_api.get_network("network_123")
 
@@ -101,98 +80,48 @@ class TestNetworksAPIGetNetwork:
         assert result["data"]["wan_ip"] == "203.0.113.42"
         assert result["data"]["geo_ip"]["isp"] == "Example ISP"
 
-    @pytest.mark.asyncio
-    async def test_get_network_not_authenticated(self, networks_api):
-        """Test get_network raises when not authenticated."""
-        networks_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await networks_api.get_network("network_123")
-
 
 class TestNetworksAPIGuestNetwork:
     """Tests for guest network management."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_guest_network_returns_raw_response(self, networks_api, mock_session):
-        """Test enabling guest network returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await networks_api.set_guest_network("network_123", enabled=True)
-
-        assert "meta" in result
-
-    @pytest.mark.asyncio
-    async def test_set_guest_network_with_credentials(self, networks_api, mock_session):
-        """Test setting guest network with name and password."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
+    @pytest.mark.parametrize(
+        "enabled,name,password,expected_payload",
+        [
+            (True, None, None, {"enabled": True}),
+            (
+                True,
+                "My Guest Network",
+                "securepass123",
+                {"enabled": True, "name": "My Guest Network", "password": "securepass123"},
+            ),
+            (False, None, None, {"enabled": False}),
+        ],
+        ids=["enable", "with_credentials", "disable"],
+    )
+    async def test_set_guest_network(
+        self, networks_api, recorded_requests, enabled, name, password, expected_payload
+    ):
+        """Test set_guest_network PUTs only the given fields to guestnetwork."""
         result = await networks_api.set_guest_network(
-            "network_123",
-            enabled=True,
-            name="My Guest Network",
-            password="securepass123",
+            "network_123", enabled=enabled, name=name, password=password
         )
 
         assert "meta" in result
-        # Verify payload includes name and password
-        call_args = mock_session.request.call_args
-        assert "json" in call_args.kwargs
-        payload = call_args.kwargs["json"]
-        assert payload["enabled"] is True
-        assert payload["name"] == "My Guest Network"
-        assert payload["password"] == "securepass123"
-
-    @pytest.mark.asyncio
-    async def test_set_guest_network_targets_guestnetwork_endpoint(
-        self, networks_api, mock_session
-    ):
-        """Test set_guest_network uses guestnetwork endpoint (not guest_network)."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await networks_api.set_guest_network("network_123", enabled=True)
-
-        call_args = mock_session.request.call_args
-        url = call_args.args[1] if len(call_args.args) > 1 else call_args.kwargs.get("url", "")
-        assert "guestnetwork" in url
-        assert "guest_network" not in url
+        method, url, kwargs = recorded_requests.calls[-1]
+        assert method == "PUT"
+        # The endpoint is guestnetwork, not guest_network
+        assert url.endswith("networks/network_123/guestnetwork")
+        assert kwargs["json"] == expected_payload
 
 
 class TestNetworksAPISpeedTest:
     """Tests for speed test functionality."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_run_speed_test_returns_raw_response(self, networks_api, mock_session):
+    async def test_run_speed_test_returns_raw_response(self, networks_api, recorded_requests):
         """Test running a speed test returns raw response."""
-        speed_data = {
-            "down": {"value": 500.0, "units": "Mbps"},
-            "up": {"value": 50.0, "units": "Mbps"},
-        }
-        expected_response = api_success_response(speed_data)
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        expected_response = api_success_response(SPEED_DATA)
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
         result = await networks_api.run_speed_test("network_123")
 
@@ -205,55 +134,21 @@ class TestNetworksAPISpeedTest:
 class TestNetworksAPIReboot:
     """Tests for network reboot functionality."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_reboot_network_returns_raw_response(self, networks_api, mock_session):
+    async def test_reboot_network_returns_raw_response(self, networks_api, recorded_requests):
         """Test successful network reboot returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
         result = await networks_api.reboot_network("network_123")
 
         assert "meta" in result
 
-    @pytest.mark.asyncio
-    async def test_reboot_network_not_authenticated(self, networks_api):
-        """Test reboot raises when not authenticated."""
-        networks_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await networks_api.reboot_network("network_123")
-
 
 class TestNetworksAPIPremium:
     """Tests for premium status checking."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_get_premium_status_returns_raw_response(self, networks_api, mock_session):
+    async def test_get_premium_status_returns_raw_response(self, networks_api, recorded_requests):
         """Test getting premium status returns raw response."""
-        network_data = {
-            "id": "network_123",
-            "premium_status": {"active": True, "features": ["ad-block", "malware"]},
-        }
-        expected_response = api_success_response(network_data)
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        expected_response = api_success_response(PREMIUM_NETWORK_DATA)
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
         result = await networks_api.get_premium_status("network_123")
 
@@ -266,46 +161,37 @@ class TestNetworksAPIPremium:
 class TestNetworksAPISetName:
     """Tests for setting network name."""
 
-    @pytest.fixture
-    def networks_api(self, mock_session):
-        """Create a NetworksAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return NetworksAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_network_name_returns_raw_response(self, networks_api, mock_session):
-        """Test successful network name change returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await networks_api.set_network_name("network_123", "New Network Name")
+    async def test_set_network_name_sends_payload_to_settings_endpoint(
+        self, networks_api, recorded_requests
+    ):
+        """Test set_network_name PUTs the name to /settings and returns raw response."""
+        result = await networks_api.set_network_name("network_123", "My Network")
 
         assert "meta" in result
+        method, url, kwargs = recorded_requests.calls[-1]
+        assert method == "PUT"
+        assert kwargs["json"] == {"name": "My Network"}
+        assert "networks/network_123/settings" in url
 
-    @pytest.mark.asyncio
-    async def test_set_network_name_sends_correct_payload(self, networks_api, mock_session):
-        """Test that correct payload is sent for name change."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await networks_api.set_network_name("network_123", "My Network")
-
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"name": "My Network"}
-
-    @pytest.mark.asyncio
-    async def test_set_network_name_targets_settings_endpoint(self, networks_api, mock_session):
-        """Test set_network_name sends request to /settings endpoint."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
 
-        await networks_api.set_network_name("network_123", "My Network")
+class TestNetworksAPINotAuthenticated:
+    """Tests that every NetworksAPI call requires an auth token."""
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_networks", ()),
+            ("get_network", ("network_123",)),
+            ("set_guest_network", ("network_123", True)),
+            ("run_speed_test", ("network_123",)),
+            ("reboot_network", ("network_123",)),
+            ("get_premium_status", ("network_123",)),
+            ("set_network_name", ("network_123", "New Name")),
+        ],
+    )
+    async def test_not_authenticated(self, networks_api, method, args):
+        """Test each method raises when not authenticated."""
+        networks_api._auth_api.get_auth_token = no_auth_token
 
-        call_args = mock_session.request.call_args
-        url = call_args.args[1] if len(call_args.args) > 1 else call_args.kwargs.get("url", "")
-        assert "networks/network_123/settings" in url
+        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
+            await getattr(networks_api, method)(*args)
@@ -1,13 +1,11 @@
 """Tests for PasswordAPI module."""
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.password import PasswordAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
 
 
 class TestPasswordAPIInit:
@@ -15,8 +13,7 @@ class TestPasswordAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
         api = PasswordAPI(auth_api)
         assert api._auth_api is auth_api
 
@@ -24,19 +21,10 @@ class TestPasswordAPIInit:
 class TestPasswordAPIGetPassword:
     """Tests for get_password method."""
 
-    @pytest.fixture
-    def password_api(self, mock_session):
-        """Create a PasswordAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return PasswordAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_password_returns_raw_response(self, password_api, mock_session):
         """Test get_password returns raw response."""
         password_data = {"password": "secure123", "ssid": "MyNetwork"}
-        mock_response = create_mock_response(200, api_success_response(password_data))
+        mock_response = StubResponse(200, api_success_response(password_data))
         mock_session.request.return_value = mock_response
 
         result = await password_api.get_password("network_123")
@@ -44,10 +32,14 @@ class TestPasswordAPIGetPassword:
         assert "meta" in result
         assert "data" in result
 
-    @pytest.mark.asyncio
-    async def test_get_password_not_authenticated(self, password_api):
-        """Test get_password raises when not authenticated."""
-        password_api._auth_api.get_auth_token = AsyncMock(return_value=None)
+
+class TestPasswordAPINotAuthenticated:
+    """Tests that every PasswordAPI call requires an auth token."""
+
+    @pytest.mark.parametrize("method,args", [("get_password", ("network_123",))])
+    async def test_not_authenticated(self, password_api, method, args):
+        """Test each method raises when not authenticated."""
+        password_api._auth_api.get_auth_token = no_auth_token
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await password_api.get_password("network_123")
+            await getattr(password_api, method)(*args)
@@ -9,14 +9,26 @@ Tests cover:
 - Blocked applications management (Eero Plus)
 """
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.profiles import ProfilesAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
+
+DEVICE_ENTRIES = [
+    {"url": "/2.2/networks/net123/devices/dev001"},
+    {"url": "/2.2/networks/net123/devices/dev002"},
+]
+NEW_PROFILE_DATA = {
+    "url": "/2.2/networks/network_123/profiles/new_profile_001",
+    "name": "Kids",
+    "paused": False,
+    "devices": [],
+}
+RENAMED_PROFILE_DATA = {"name": "New Name", "paused": False}
+# delete_profile responses carry no data envelope.
+META_ONLY = {"meta": {"code": 200}}
 
 
 class TestProfilesAPIInit:
@@ -24,8 +36,7 @@ class TestProfilesAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
 
         api = ProfilesAPI(auth_api)
 
@@ -35,22 +46,13 @@ class TestProfilesAPIInit:
 class TestProfilesAPIGetProfiles:
     """Tests for get_profiles method."""
 
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_profiles_returns_raw_response(
         self, profiles_api, mock_session, sample_profile_data
     ):
         """Test get_profiles returns raw API response."""
         profiles_list = [sample_profile_data]
         expected_response = api_success_response(profiles_list)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await profiles_api.get_profiles("network_123")
@@ -58,33 +60,16 @@ class TestProfilesAPIGetProfiles:
         assert "meta" in result
         assert "data" in result
 
-    @pytest.mark.asyncio
-    async def test_get_profiles_not_authenticated(self, profiles_api):
-        """Test get_profiles raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await profiles_api.get_profiles("network_123")
-
 
 class TestProfilesAPIGetProfile:
     """Tests for get_profile method."""
 
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_profile_returns_raw_response(
         self, profiles_api, mock_session, sample_profile_data
     ):
         """Test get_profile returns raw API response."""
         expected_response = api_success_response(sample_profile_data)
-        mock_response = create_mock_response(200, expected_response)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await profiles_api.get_profile("network_123", "profile_001")
@@ -94,401 +79,222 @@ class TestProfilesAPIGetProfile:
         assert result["data"]["name"] == "Kids"
         assert result["data"]["paused"] is False
 
-    @pytest.mark.asyncio
-    async def test_get_profile_not_authenticated(self, profiles_api):
-        """Test get_profile raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.get_profile("network_123", "profile_001")
 
-
-class TestProfilesAPIPauseProfile:
-    """Tests for pause_profile method."""
-
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_pause_profile_returns_raw_response(self, profiles_api, mock_session):
-        """Test successful profile pause returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await profiles_api.pause_profile("network_123", "profile_001", True)
-
-        assert "meta" in result
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"paused": True}
-
-    @pytest.mark.asyncio
-    async def test_pause_profile_not_authenticated(self, profiles_api):
-        """Test pause_profile raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.pause_profile("network_123", "profile_001", True)
-
-
-class TestProfilesAPIContentFilter:
-    """Tests for content filter management."""
-
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_update_content_filter_returns_raw_response(self, profiles_api, mock_session):
-        """Test updating content filter returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await profiles_api.update_profile_content_filter(
-            "network_123",
-            "profile_001",
-            {"safe_search": True, "block_adult": True},
-        )
-
-        assert "meta" in result
-        call_args = mock_session.request.call_args
-        payload = call_args.kwargs["json"]
-        assert payload["content_filter"]["safe_search"] is True
-        assert payload["content_filter"]["block_adult"] is True
-
-    @pytest.mark.asyncio
-    async def test_update_content_filter_not_authenticated(self, profiles_api):
-        """Test update_profile_content_filter raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.update_profile_content_filter(
-                "network_123", "profile_001", {"safe_search": True}
-            )
-
-
-class TestProfilesAPIBlockList:
-    """Tests for custom block/allow list management."""
-
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_update_block_list_returns_raw_response(self, profiles_api, mock_session):
-        """Test updating custom block list returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await profiles_api.update_profile_block_list(
-            "network_123",
-            "profile_001",
-            ["example.com", "badsite.com"],
-            block=True,
-        )
+class TestProfilesAPIUpdateProfile:
+    """Tests for methods that PUT an update to the profile URL."""
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs,expected_json",
+        [
+            ("pause_profile", (True,), {}, {"paused": True}),
+            ("pause_profile", (False,), {}, {"paused": False}),
+            (
+                "update_profile_content_filter",
+                ({"safe_search": True, "block_adult": True},),
+                {},
+                {"content_filter": {"safe_search": True, "block_adult": True}},
+            ),
+            (
+                "update_profile_block_list",
+                (["example.com", "badsite.com"],),
+                {"block": True},
+                {"custom_block_list": ["example.com", "badsite.com"]},
+            ),
+            (
+                "update_profile_block_list",
+                (["example.com", "badsite.com"],),
+                {"block": False},
+                {"custom_allow_list": ["example.com", "badsite.com"]},
+            ),
+            (
+                "set_blocked_applications",
+                (["youtube", "netflix"],),
+                {},
+                {"blocked_applications": ["youtube", "netflix"]},
+            ),
+            ("set_blocked_applications", ([],), {}, {"blocked_applications": []}),
+            (
+                "set_profile_devices",
+                (["/2.2/networks/net123/devices/dev001", "/2.2/networks/net123/devices/dev002"],),
+                {},
+                {"devices": DEVICE_ENTRIES},
+            ),
+            ("set_profile_devices", ([],), {}, {"devices": []}),
+            ("rename_profile", ("New Name",), {}, {"name": "New Name"}),
+        ],
+        ids=[
+            "pause_profile-pause",
+            "pause_profile-unpause",
+            "update_profile_content_filter",
+            "update_profile_block_list-block",
+            "update_profile_block_list-allow",
+            "set_blocked_applications-some",
+            "set_blocked_applications-empty",
+            "set_profile_devices-some",
+            "set_profile_devices-empty",
+            "rename_profile",
+        ],
+    )
+    async def test_update_puts_payload_to_profile(
+        self, profiles_api, recorded_requests, method, args, kwargs, expected_json
+    ):
+        """Test each profile update PUTs its payload to the profile URL."""
+        result = await getattr(profiles_api, method)("network_123", "profile_001", *args, **kwargs)
 
         assert "meta" in result
-        call_args = mock_session.request.call_args
-        payload = call_args.kwargs["json"]
-        assert payload["custom_block_list"] == ["example.com", "badsite.com"]
-
-    @pytest.mark.asyncio
-    async def test_update_block_list_not_authenticated(self, profiles_api):
-        """Test update_profile_block_list raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.update_profile_block_list(
-                "network_123", "profile_001", ["example.com"]
-            )
-
-
-class TestProfilesAPIBlockedApplications:
-    """Tests for blocked applications management (Eero Plus)."""
-
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_get_blocked_applications_returns_raw_response(self, profiles_api, mock_session):
-        """Test getting blocked applications returns raw response."""
-        profile_data = {
-            "name": "Kids",
-            "premium_dns": {
-                "blocked_applications": ["youtube", "tiktok", "fortnite"],
-            },
-        }
-        expected_response = api_success_response(profile_data)
-        mock_response = create_mock_response(200, expected_response)
+        http_method, url, request_kwargs = recorded_requests.calls[-1]
+        assert http_method == "PUT"
+        assert url.endswith("networks/network_123/profiles/profile_001")
+        assert request_kwargs["json"] == expected_json
+
+
+class TestProfilesAPIGetBlockedApplications:
+    """Tests for get_blocked_applications method (Eero Plus)."""
+
+    @pytest.mark.parametrize(
+        "profile_data",
+        [
+            {"name": "Kids", "premium_dns": {"blocked_applications": ["youtube", "tiktok"]}},
+            {"name": "Kids", "blocked_applications": ["instagram"]},
+            {"name": "Kids"},
+        ],
+        ids=["premium_dns", "direct_field", "absent"],
+    )
+    async def test_get_blocked_applications_returns_raw_response(
+        self, profiles_api, mock_session, profile_data
+    ):
+        """Test get_blocked_applications passes every response shape through untouched."""
+        raw = api_success_response(profile_data)
+        mock_response = StubResponse(200, raw)
         mock_session.request.return_value = mock_response
 
         result = await profiles_api.get_blocked_applications("network_123", "profile_001")
 
-        assert "meta" in result
-        assert "data" in result
+        assert result == raw
 
-    @pytest.mark.asyncio
-    async def test_get_blocked_applications_not_authenticated(self, profiles_api):
-        """Test get_blocked_applications raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
 
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.get_blocked_applications("network_123", "profile_001")
+class TestProfilesAPIGetProfileDevices:
+    """Tests for get_profile_devices method."""
 
-    @pytest.mark.asyncio
-    async def test_set_blocked_applications_returns_raw_response(self, profiles_api, mock_session):
-        """Test setting blocked applications returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        result = await profiles_api.set_blocked_applications(
-            "network_123", "profile_001", ["youtube", "netflix"]
-        )
-
-        assert "meta" in result
-        call_args = mock_session.request.call_args
-        payload = call_args.kwargs["json"]
-        assert payload["blocked_applications"] == ["youtube", "netflix"]
-
-    @pytest.mark.asyncio
-    async def test_set_blocked_applications_not_authenticated(self, profiles_api):
-        """Test set_blocked_applications raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.set_blocked_applications("network_123", "profile_001", ["youtube"])
-
-
-class TestProfilesAPIDeviceManagement:
-    """Tests for profile device management."""
-
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_get_profile_devices_returns_raw_response(self, profiles_api, mock_session):
-        """Test getting devices assigned to a profile returns raw response."""
-        profile_data = {
-            "name": "Kids",
-            "devices": [
-                {"url": "/2.2/networks/net123/devices/dev001"},
-                {"url": "/2.2/networks/net123/devices/dev002"},
-            ],
-        }
-        expected_response = api_success_response(profile_data)
-        mock_response = create_mock_response(200, expected_response)
+    @pytest.mark.parametrize(
+        "profile_data",
+        [
+            {"name": "Kids", "devices": DEVICE_ENTRIES},
+            {"name": "Kids", "devices": []},
+            {"name": "Kids"},
+        ],
+        ids=["devices", "empty", "absent"],
+    )
+    async def test_get_profile_devices_returns_raw_response(
+        self, profiles_api, mock_session, profile_data
+    ):
+        """Test get_profile_devices passes every response shape through untouched."""
+        raw = api_success_response(profile_data)
+        mock_response = StubResponse(200, raw)
         mock_session.request.return_value = mock_response
 
         result = await profiles_api.get_profile_devices("network_123", "profile_001")
 
-        assert "meta" in result
-        assert "data" in result
-
-    @pytest.mark.asyncio
-    async def test_get_profile_devices_not_authenticated(self, profiles_api):
-        """Test get_profile_devices raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.get_profile_devices("network_123", "profile_001")
-
-    @pytest.mark.asyncio
-    async def test_set_profile_devices_returns_raw_response(self, profiles_api, mock_session):
-        """Test setting devices for a profile returns raw response."""
-        expected_response = {"meta": {"code": 200}, "data": {}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        device_urls = [
-            "/2.2/networks/net123/devices/dev001",
-            "/2.2/networks/net123/devices/dev002",
-        ]
-        result = await profiles_api.set_profile_devices("network_123", "profile_001", device_urls)
-
-        assert "meta" in result
-        call_args = mock_session.request.call_args
-        payload = call_args.kwargs["json"]
-        assert payload["devices"] == [
-            {"url": "/2.2/networks/net123/devices/dev001"},
-            {"url": "/2.2/networks/net123/devices/dev002"},
-        ]
-
-    @pytest.mark.asyncio
-    async def test_set_profile_devices_not_authenticated(self, profiles_api):
-        """Test set_profile_devices raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.set_profile_devices(
-                "network_123", "profile_001", ["/2.2/networks/net123/devices/dev001"]
-            )
+        assert result == raw
 
 
 class TestProfilesAPICreateProfile:
     """Tests for create_profile method."""
 
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_create_profile_returns_raw_response(self, profiles_api, mock_session):
+    async def test_create_profile_returns_raw_response(self, profiles_api, recorded_requests):
         """Test creating a profile returns raw response with profile data."""
-        profile_data = {
-            "url": "/2.2/networks/network_123/profiles/new_profile_001",
-            "name": "Kids",
-            "paused": False,
-            "devices": [],
-        }
-        expected_response = api_success_response(profile_data)
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        expected_response = api_success_response(NEW_PROFILE_DATA)
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
         result = await profiles_api.create_profile("network_123", "Kids")
 
         assert "meta" in result
         assert "data" in result
         assert result["data"]["name"] == "Kids"
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"name": "Kids"}
+        _, _, kwargs = recorded_requests.calls[-1]
+        assert kwargs["json"] == {"name": "Kids"}
 
-    @pytest.mark.asyncio
-    async def test_create_profile_uses_post_method(self, profiles_api, mock_session):
+    async def test_create_profile_uses_post_method(self, profiles_api, recorded_requests):
         """Test create_profile sends a POST request."""
-        expected_response = api_success_response({"name": "Test"})
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        expected_response = api_success_response(NEW_PROFILE_DATA)
+        mock_response = StubResponse(200, expected_response)
+        recorded_requests.response = mock_response
 
-        await profiles_api.create_profile("network_123", "Test")
+        await profiles_api.create_profile("network_123", "Kids")
 
-        call_args = mock_session.request.call_args
-        assert call_args.args[0] == "POST"
-
-    @pytest.mark.asyncio
-    async def test_create_profile_not_authenticated(self, profiles_api):
-        """Test create_profile raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
-            await profiles_api.create_profile("network_123", "Kids")
+        method, _, _ = recorded_requests.calls[-1]
+        assert method == "POST"
 
 
 class TestProfilesAPIRenameProfile:
     """Tests for rename_profile method."""
 
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_rename_profile_returns_raw_response(self, profiles_api, mock_session):
         """Test renaming a profile returns raw response."""
-        profile_data = {"name": "New Name", "paused": False}
-        expected_response = api_success_response(profile_data)
-        mock_response = create_mock_response(200, expected_response)
+        expected_response = api_success_response(RENAMED_PROFILE_DATA)
+        mock_response = StubResponse(200, expected_response)
         mock_session.request.return_value = mock_response
 
         result = await profiles_api.rename_profile("network_123", "profile_001", "New Name")
 
         assert "meta" in result
         assert result["data"]["name"] == "New Name"
-        call_args = mock_session.request.call_args
-        assert call_args.kwargs["json"] == {"name": "New Name"}
-
-    @pytest.mark.asyncio
-    async def test_rename_profile_uses_put_method(self, profiles_api, mock_session):
-        """Test rename_profile sends a PUT request."""
-        expected_response = api_success_response({"name": "Renamed"})
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
-
-        await profiles_api.rename_profile("network_123", "profile_001", "Renamed")
-
-        call_args = mock_session.request.call_args
-        assert call_args.args[0] == "PUT"
-
-    @pytest.mark.asyncio
-    async def test_rename_profile_not_authenticated(self, profiles_api):
-        """Test rename_profile raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
-
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.rename_profile("network_123", "profile_001", "New Name")
 
 
 class TestProfilesAPIDeleteProfile:
     """Tests for delete_profile method."""
 
-    @pytest.fixture
-    def profiles_api(self, mock_session):
-        """Create a ProfilesAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ProfilesAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_delete_profile_returns_raw_response(self, profiles_api, mock_session):
+    async def test_delete_profile_returns_raw_response(self, profiles_api, recorded_requests):
         """Test deleting a profile returns raw response."""
-        expected_response = {"meta": {"code": 200}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_response = StubResponse(200, META_ONLY)
+        recorded_requests.response = mock_response
 
         result = await profiles_api.delete_profile("network_123", "profile_001")
 
         assert "meta" in result
         assert result["meta"]["code"] == 200
 
-    @pytest.mark.asyncio
-    async def test_delete_profile_uses_delete_method(self, profiles_api, mock_session):
+    async def test_delete_profile_uses_delete_method(self, profiles_api, recorded_requests):
         """Test delete_profile sends a DELETE request."""
-        expected_response = {"meta": {"code": 200}}
-        mock_response = create_mock_response(200, expected_response)
-        mock_session.request.return_value = mock_response
+        mock_response = StubResponse(200, META_ONLY)
+        recorded_requests.response = mock_response
 
         await profiles_api.delete_profile("network_123", "profile_001")
 
-        call_args = mock_session.request.call_args
-        assert call_args.args[0] == "DELETE"
-
-    @pytest.mark.asyncio
-    async def test_delete_profile_not_authenticated(self, profiles_api):
-        """Test delete_profile raises when not authenticated."""
-        profiles_api._auth_api.get_auth_token = AsyncMock(return_value=None)
+        method, _, _ = recorded_requests.calls[-1]
+        assert method == "DELETE"
+
+
+class TestProfilesAPINotAuthenticated:
+    """Tests that every ProfilesAPI call requires an auth token."""
+
+    @pytest.mark.parametrize(
+        "method,args",
+        [
+            ("get_profiles", ("network_123",)),
+            ("get_profile", ("network_123", "profile_001")),
+            ("pause_profile", ("network_123", "profile_001", True)),
+            (
+                "update_profile_content_filter",
+                ("network_123", "profile_001", {"safe_search": True}),
+            ),
+            ("update_profile_block_list", ("network_123", "profile_001", ["example.com"])),
+            ("get_blocked_applications", ("network_123", "profile_001")),
+            ("set_blocked_applications", ("network_123", "profile_001", ["youtube"])),
+            ("get_profile_devices", ("network_123", "profile_001")),
+            (
+                "set_profile_devices",
+                ("network_123", "profile_001", ["/2.2/networks/net123/devices/dev001"]),
+            ),
+            ("create_profile", ("network_123", "Kids")),
+            ("rename_profile", ("network_123", "profile_001", "New Name")),
+            ("delete_profile", ("network_123", "profile_001")),
+        ],
+    )
+    async def test_not_authenticated(self, profiles_api, method, args):
+        """Test each method raises when not authenticated."""
+        profiles_api._auth_api.get_auth_token = no_auth_token
 
-        with pytest.raises(EeroAuthenticationException):
-            await profiles_api.delete_profile("network_123", "profile_001")
+        with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
+            await getattr(profiles_api, method)(*args)
@@ -3,14 +3,17 @@
 Tests cover profile schedule and bedtime settings.
 """
 
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from eero.api.schedule import ScheduleAPI
 from eero.exceptions import EeroAuthenticationException
 
-from .conftest import api_success_response, create_mock_response
+from .conftest import StubAuthAPI, StubResponse, api_success_response, no_auth_token
+
+SCHEDULE_DATA = {"schedule": [{"days": ["monday"], "start": "21:00", "end": "07:00"}]}
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+WEEKEND = ["saturday", "sunday"]
+ALL_DAYS = WEEKDAYS + WEEKEND
 
 
 class TestScheduleAPIInit:
@@ -18,8 +21,7 @@ class TestScheduleAPIInit:
 
     def test_init_with_auth_api(self, mock_session):
         """Test initialization with AuthAPI."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
+        auth_api = StubAuthAPI(mock_session)
         api = ScheduleAPI(auth_api)
         assert api._auth_api is auth_api
 
@@ -27,19 +29,9 @@ class TestScheduleAPIInit:
 class TestScheduleAPIGetSchedule:
     """Tests for get_profile_schedule method."""
 
-    @pytest.fixture
-    def schedule_api(self, mock_session):
-        """Create a ScheduleAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ScheduleAPI(auth_api)
-
-    @pytest.mark.asyncio
     async def test_get_profile_schedule_returns_raw_response(self, schedule_api, mock_session):
         """Test getting profile schedule returns raw response."""
-        profile_data = {"schedule": [{"days": ["monday"], "start": "21:00", "end": "07:00"}]}
-        mock_response = create_mock_response(200, api_success_response(profile_data))
+        mock_response = StubResponse(200, api_success_response(SCHEDULE_DATA))
         mock_session.request.return_value = mock_response
 
         result = await schedule_api.get_profile_schedule("network_123", "profile_001")
@@ -47,10 +39,9 @@ class TestScheduleAPIGetSchedule:
         assert "meta" in result
         assert "data" in result
 
-    @pytest.mark.asyncio
     async def test_get_profile_schedule_not_authenticated(self, schedule_api):
         """Test get_profile_schedule raises when not authenticated."""
-        schedule_api._auth_api.get_auth_token = AsyncMock(return_value=None)
+        schedule_api._auth_api.get_auth_token = no_auth_token
 
         with pytest.raises(EeroAuthenticationException, match="Not authenticated"):
             await schedule_api.get_profile_schedule("network_123", "profile_001")
@@ -59,29 +50,23 @@ class TestScheduleAPIGetSchedule:
 class TestScheduleAPISetSchedule:
     """Tests for set_profile_schedule method."""
 
-    @pytest.fixture
-    def schedule_api(self, mock_session):
-        """Create a ScheduleAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ScheduleAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_set_profile_schedule_returns_raw_response(self, schedule_api, mock_session):
+    async def test_set_profile_schedule_returns_raw_response(
+        self, schedule_api, mock_session, empty_ok_response
+    ):
         """Test setting profile schedule returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
-        time_blocks = [{"days": ["monday"], "start": "21:00", "end": "07:00"}]
-        result = await schedule_api.set_profile_schedule("network_123", "profile_001", time_blocks)
+        result = await schedule_api.set_profile_schedule(
+            "network_123",
+            "profile_001",
+            [{"days": ["monday"], "start": "21:00", "end": "07:00"}],
+        )
 
         assert "meta" in result
 
-    @pytest.mark.asyncio
     async def test_set_profile_schedule_not_authenticated(self, schedule_api):
         """Test set_profile_schedule raises when not authenticated."""
-        schedule_api._auth_api.get_auth_token = AsyncMock(return_value=None)
+        schedule_api._auth_api.get_auth_token = no_auth_token
 
         with pytest.raises(EeroAuthenticationException):
             await schedule_api.set_profile_schedule("network_123", "profile_001", [])
@@ -90,41 +75,36 @@ class TestScheduleAPISetSchedule:
 class TestScheduleAPIBedtime:
     """Tests for bedtime methods."""
 
-    @pytest.fixture
-    def schedule_api(self, mock_session):
-        """Create a ScheduleAPI with mocked auth."""
-        auth_api = MagicMock()
-        auth_api.session = mock_session
-        auth_api.get_auth_token = AsyncMock(return_value="auth_token")
-        return ScheduleAPI(auth_api)
-
-    @pytest.mark.asyncio
-    async def test_enable_bedtime_returns_raw_response(self, schedule_api, mock_session):
-        """Test enabling bedtime returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
-
-        result = await schedule_api.enable_bedtime("network_123", "profile_001", "21:00", "07:00")
+    @pytest.mark.parametrize(
+        "method,args,expected_days",
+        [
+            ("enable_bedtime", ("21:00", "07:00"), ALL_DAYS),
+            ("enable_bedtime", ("21:00", "07:00", ["friday"]), ["friday"]),
+            ("set_weekday_bedtime", ("21:00", "07:00"), WEEKDAYS),
+            ("set_weekend_bedtime", ("21:00", "07:00"), WEEKEND),
+        ],
+        ids=["enable_bedtime-all_days", "enable_bedtime-some_days", "weekday", "weekend"],
+    )
+    async def test_bedtime_returns_raw_response(
+        self, schedule_api, recorded_requests, method, args, expected_days
+    ):
+        """Test each bedtime helper PUTs one bedtime block for the expected days."""
+        result = await getattr(schedule_api, method)("network_123", "profile_001", *args)
 
         assert "meta" in result
-
-    @pytest.mark.asyncio
-    async def test_set_weekday_bedtime_returns_raw_response(self, schedule_api, mock_session):
-        """Test setting weekday bedtime returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
-
-        result = await schedule_api.set_weekday_bedtime(
-            "network_123", "profile_001", "21:00", "07:00"
-        )
-
-        assert "meta" in result
-
-    @pytest.mark.asyncio
-    async def test_clear_profile_schedule_returns_raw_response(self, schedule_api, mock_session):
+        http_method, _, kwargs = recorded_requests.calls[-1]
+        assert http_method == "PUT"
+        assert kwargs["json"] == {
+            "schedule": [
+                {"days": expected_days, "start": "21:00", "end": "07:00", "type": "bedtime"}
+            ]
+        }
+
+    async def test_clear_profile_schedule_returns_raw_response(
+        self, schedule_api, mock_session, empty_ok_response
+    ):
         """Test clearing profile schedule returns raw response."""
-        mock_response = create_mock_response(200, {"meta": {"code": 200}, "data": {}})
-        mock_session.request.return_value = mock_response
+        mock_session.request.return_value = empty_ok_response
 
         result = await schedule_api.clear_profile_schedule("network_123", "profile_001")
 